@@ -391,6 +391,11 @@ class RoborockDataUpdateCoordinatorA01(DataUpdateCoordinator[dict[_V, StateType]
         )
         self.request_protocols: list[_V] = []
 
+    @cached_property
+    def request_protocols_set(self) -> frozenset[_V]:
+        """Get the requested protocols for fast membership checks."""
+        return frozenset(self.request_protocols)
+
     @cached_property
     def duid(self) -> str:
         """Get the unique id of the device as specified by Roborock."""
@@ -549,6 +554,8 @@ class RoborockB01Q7UpdateCoordinator(RoborockDataUpdateCoordinatorB01):
             RoborockB01Props.CLEANING_TIME,
             RoborockB01Props.REAL_CLEAN_TIME,
             RoborockB01Props.HYPA,
+            RoborockB01Props.WIND,
+            RoborockB01Props.CLEANING_AREA,
         ]
 
     async def _async_update_data(
@@ -1,7 +1,6 @@
 """Support for Roborock device base class."""
 
 from typing import Any
-import logging
 
 from roborock.data import Status
 from roborock.devices.traits.v1.command import CommandTrait
@@ -20,15 +19,14 @@ from .coordinator import (
     RoborockDataUpdateCoordinatorB01,
 )
 
-_LOGGER = logging.getLogger(__name__)
-
 
 class RoborockEntity(Entity):
     """Representation of a base Roborock Entity."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, unique_id: str, device_info: DeviceInfo) -> None:
+    def __init__(self, unique_id: str, device_info: DeviceInfo, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
         self._attr_unique_id = unique_id
         self._attr_device_info = device_info
 
@@ -36,8 +34,8 @@ class RoborockEntity(Entity):
 class RoborockEntityV1(RoborockEntity):
     """Base class for Roborock V1 devices."""
 
-    def __init__(self, unique_id: str, device_info: DeviceInfo, api: CommandTrait) -> None:
-        super().__init__(unique_id, device_info)
+    def __init__(self, unique_id: str, device_info: DeviceInfo, api: CommandTrait, **kwargs: Any) -> None:
+        super().__init__(unique_id, device_info, **kwargs)
         self._api = api
 
     async def send(self, command: RoborockCommand | str, params: dict[str, Any] | list[Any] | int | None = None) -> dict:
@@ -60,14 +58,12 @@ class RoborockCoordinatedEntityV1(RoborockEntityV1, CoordinatorEntity[RoborockDa
     """Coordinated entity for V1 devices."""
 
     def __init__(self, unique_id: str, coordinator: RoborockDataUpdateCoordinator, is_dock_entity: bool = False) -> None:
-        RoborockEntityV1.__init__(
-            self,
+        super().__init__(
             unique_id=unique_id,
-            device_info=coordinator.device_info if not is_dock_entity else coordinator.dock_device_info,
+            device_info=coordinator.dock_device_info if is_dock_entity else coordinator.device_info,
             api=coordinator.properties_api.command,
+            coordinator=coordinator,
         )
-        CoordinatorEntity.__init__(self, coordinator=coordinator)
-        self._attr_unique_id = unique_id
 
     @property
     def _device_status(self) -> Status:
@@ -75,7 +71,7 @@ class RoborockCoordinatedEntityV1(RoborockEntityV1, CoordinatorEntity[RoborockDa
 
     async def send(self, command: RoborockCommand | str, params: dict[str, Any] | list[Any] | int | None = None) -> dict:
         res = await super().send(command, params)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
         return res
 
 
@@ -83,20 +79,14 @@ class RoborockCoordinatedEntityA01(RoborockEntity, CoordinatorEntity[RoborockDat
     """Coordinated entity for A01 devices."""
 
     def __init__(self, unique_id: str, coordinator: RoborockDataUpdateCoordinatorA01) -> None:
-        RoborockEntity.__init__(self, unique_id, device_info=coordinator.device_info)
-        CoordinatorEntity.__init__(self, coordinator=coordinator)
-        self._attr_unique_id = unique_id
+        super().__init__(unique_id, device_info=coordinator.device_info, coordinator=coordinator)
 
 
 class RoborockCoordinatedEntityB01(RoborockEntity, CoordinatorEntity[RoborockDataUpdateCoordinatorB01]):
     """Coordinated entity for B01/Q7 devices."""
 
     def __init__(self, unique_id: str, coordinator: RoborockDataUpdateCoordinatorB01) -> None:
-        _LOGGER.debug("Initializing B01 coordinated entity %s", unique_id)
-        RoborockEntity.__init__(self, unique_id, device_info=coordinator.device_info)
-        CoordinatorEntity.__init__(self, coordinator=coordinator)
-        self._attr_unique_id = unique_id
-        self.coordinator = coordinator
+        super().__init__(unique_id, device_info=coordinator.device_info, coordinator=coordinator)
 
 
 class RoborockCoordinatedEntityV2(RoborockEntity):
@@ -1,4 +1,4 @@
-"""Support for Roborock sensors with detailed debug logging."""
+"""Support for Roborock sensors."""
 
 from __future__ import annotations
 
@@ -6,6 +6,7 @@ import datetime
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -53,11 +54,11 @@ class RoborockSensorDescriptionB01(SensorEntityDescription):
 
 
 def _dock_error_value_fn(state: DeviceState) -> str | None:
-    if (
-        status := state.status.dock_error_status
-    ) is not None and state.status.dock_type != 0:  # RoborockDockTypeCode.no_dock
-        return status.name
-    return None
+    status = state.status
+    dock_error = status.dock_error_status
+    if dock_error is None or status.dock_type == 0:  # RoborockDockTypeCode.no_dock
+        return None
+    return dock_error.name
 
 
 # ====================
@@ -88,6 +89,15 @@ SENSOR_DESCRIPTIONS: list[RoborockSensorDescription] = [
     ),
 ]
 
+# Dock sensors only apply when a dock is present, so split them out once
+# instead of evaluating them for every device.
+NORMAL_DESCRIPTIONS: tuple[RoborockSensorDescription, ...] = tuple(
+    description for description in SENSOR_DESCRIPTIONS if not description.is_dock_entity
+)
+DOCK_DESCRIPTIONS: tuple[RoborockSensorDescription, ...] = tuple(
+    description for description in SENSOR_DESCRIPTIONS if description.is_dock_entity
+)
+
 # ====================
 # A01 Sensors
 # ====================
@@ -114,14 +124,14 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="q7_status",
         translation_key="q7_status",
-        value_fn=lambda data: getattr(data, "status_name", None),
+        value_fn=attrgetter("status_name"),
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.ENUM,
     ),
     RoborockSensorDescriptionB01(
         key="main_brush_time_left",
         translation_key="main_brush_time_left",
-        value_fn=lambda data: getattr(data, "main_brush_time_left", None),
+        value_fn=attrgetter("main_brush_time_left"),
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -130,7 +140,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="side_brush_time_left",
         translation_key="side_brush_time_left",
-        value_fn=lambda data: getattr(data, "side_brush_time_left", None),
+        value_fn=attrgetter("side_brush_time_left"),
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -139,7 +149,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="filter_time_left",
         translation_key="filter_time_left",
-        value_fn=lambda data: getattr(data, "hypa_time_left", None),
+        value_fn=attrgetter("filter_time_left"),
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -148,7 +158,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="sensor_time_left",
         translation_key="sensor_time_left",
-        value_fn=lambda data: getattr(data, "main_sensor_time_left", None),
+        value_fn=attrgetter("sensor_dirty_time_left"),
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -157,7 +167,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="mop_life_time_left",
         translation_key="mop_life_time_left",
-        value_fn=lambda data: getattr(data, "mop_life_time_left", None),
+        value_fn=attrgetter("mop_life_time_left"),
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -166,7 +176,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="cleaning_time",
         translation_key="cleaning_time",
-        value_fn=lambda data: getattr(data, "cleaning_time", None),
+        value_fn=attrgetter("cleaning_time"),
         native_unit_of_measurement=UnitOfTime.SECONDS,
         suggested_unit_of_measurement=UnitOfTime.MINUTES,
         device_class=SensorDeviceClass.DURATION,
@@ -175,7 +185,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="total_cleaning_time",
         translation_key="total_cleaning_time",
-        value_fn=lambda data: getattr(data, "real_clean_time", None),
+        value_fn=attrgetter("real_clean_time"),
         native_unit_of_measurement=UnitOfTime.SECONDS,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
@@ -184,14 +194,7 @@ Q7_B01_SENSOR_DESCRIPTIONS: list[RoborockSensorDescriptionB01] = [
     RoborockSensorDescriptionB01(
         key="cleaning_area",
         translation_key="cleaning_area",
-        value_fn=lambda data: getattr(data, "cleaning_area", None),
-        native_unit_of_measurement=UnitOfArea.SQUARE_METERS,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    RoborockSensorDescriptionB01(
-        key="total_cleaning_area",
-        translation_key="total_cleaning_area",
-        value_fn=lambda data: getattr(data, "total_cleaning_area", None),
+        value_fn=attrgetter("cleaning_area"),
         native_unit_of_measurement=UnitOfArea.SQUARE_METERS,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
@@ -206,30 +209,31 @@ async def async_setup_entry(
     config_entry: RoborockConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Roborock sensors with debug logging."""
+    """Set up Roborock sensors."""
     coordinators = config_entry.runtime_data
     entities: list[RoborockEntity] = []
 
-    _LOGGER.debug("Setting up Roborock V1 sensors")
+    append = entities.append
+
+    # V1 and B01 sensors are always created, even if the first poll has no
+    # value yet; native_value then reports None until the device provides one.
     for coordinator in coordinators.v1:
-        for description in SENSOR_DESCRIPTIONS:
-            if description.value_fn(coordinator.data) is not None:
-                _LOGGER.debug("Adding V1 sensor %s for device %s", description.key, coordinator.duid_slug)
-                entities.append(RoborockSensorEntity(coordinator, description))
+        for description in NORMAL_DESCRIPTIONS:
+            append(RoborockSensorEntity(coordinator, description))
+        if coordinator.data.status.dock_type == 0:  # RoborockDockTypeCode.no_dock
+            continue
+        for description in DOCK_DESCRIPTIONS:
+            append(RoborockSensorEntity(coordinator, description))
 
-    _LOGGER.debug("Setting up Roborock A01 sensors")
     for coordinator in coordinators.a01:
+        request_protocols = coordinator.request_protocols_set
         for description in A01_SENSOR_DESCRIPTIONS:
-            if description.data_protocol in coordinator.request_protocols:
-                _LOGGER.debug("Adding A01 sensor %s for device %s", description.key, coordinator.duid_slug)
-                entities.append(RoborockSensorEntityA01(coordinator, description))
+            if description.data_protocol in request_protocols:
+                append(RoborockSensorEntityA01(coordinator, description))
 
-    _LOGGER.debug("Setting up Roborock B01/Q7 sensors")
     for coordinator in coordinators.b01:
         for description in Q7_B01_SENSOR_DESCRIPTIONS:
-            if description.value_fn(coordinator.data) is not None:
-                _LOGGER.debug("Adding B01 sensor %s for device %s", description.key, coordinator.duid_slug)
-                entities.append(RoborockSensorEntityB01(coordinator, description))
+            append(RoborockSensorEntityB01(coordinator, description))
 
     _LOGGER.debug("Adding %d sensors in total", len(entities))
     async_add_entities(entities)
@@ -245,14 +249,11 @@ class RoborockSensorEntity(RoborockCoordinatedEntityV1, SensorEntity):
 
     def __init__(self, coordinator: RoborockDataUpdateCoordinator, description: RoborockSensorDescription) -> None:
         self.entity_description = description
-        _LOGGER.debug("Initializing V1 sensor entity %s", description.key)
         super().__init__(f"{description.key}_{coordinator.duid_slug}", coordinator, is_dock_entity=description.is_dock_entity)
 
     @property
     def native_value(self) -> StateType | datetime.datetime:
-        value = self.entity_description.value_fn(self.coordinator.data)
-        _LOGGER.debug("V1 sensor %s value: %s", self.entity_description.key, value)
-        return value
+        return self.entity_description.value_fn(self.coordinator.data)
 
 
 class RoborockSensorEntityA01(RoborockCoordinatedEntityA01, SensorEntity):
@@ -262,14 +263,11 @@ class RoborockSensorEntityA01(RoborockCoordinatedEntityA01, SensorEntity):
 
     def __init__(self, coordinator: RoborockDataUpdateCoordinatorA01, description: RoborockSensorDescriptionA01) -> None:
         self.entity_description = description
-        _LOGGER.debug("Initializing A01 sensor entity %s", description.key)
         super().__init__(f"{description.key}_{coordinator.duid_slug}", coordinator)
 
     @property
     def native_value(self) -> StateType:
-        value = self.coordinator.data[self.entity_description.data_protocol]
-        _LOGGER.debug("A01 sensor %s value: %s", self.entity_description.key, value)
-        return value
+        return self.coordinator.data[self.entity_description.data_protocol]
 
 
 class RoborockSensorEntityB01(RoborockCoordinatedEntityB01, SensorEntity):
@@ -279,11 +277,8 @@ class RoborockSensorEntityB01(RoborockCoordinatedEntityB01, SensorEntity):
 
     def __init__(self, coordinator: RoborockDataUpdateCoordinatorB01, description: RoborockSensorDescriptionB01) -> None:
         self.entity_description = description
-        _LOGGER.debug("Initializing B01 sensor entity %s", description.key)
         super().__init__(f"{description.key}_{coordinator.duid_slug}", coordinator)
 
     @property
     def native_value(self) -> StateType:
-        value = self.entity_description.value_fn(self.coordinator.data)
-        _LOGGER.debug("B01 sensor %s value: %s", self.entity_description.key, value)
-        return value
+        return self.entity_description.value_fn(self.coordinator.data)
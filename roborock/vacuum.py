@@ -11,13 +11,38 @@ from roborock.data.b01_q7.b01_q7_code_mappings import SCWindMapping, WaterLevelM
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import RoborockDataUpdateCoordinatorB01
+from .coordinator import RoborockB01Q7UpdateCoordinator
 from .entity import RoborockCoordinatedEntityB01
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+_FAN_SPEED_LIST: list[str] = [mode.value for mode in SCWindMapping]
+_FAN_SPEED_MEMBERS: dict[str, SCWindMapping] = {mode.value: mode for mode in SCWindMapping}
+
+_STATUS_TO_ACTIVITY: dict[str, VacuumActivity] = {
+    "cleaning": VacuumActivity.CLEANING,
+    "sweep_moping": VacuumActivity.CLEANING,
+    "sweep_moping_2": VacuumActivity.CLEANING,
+    "moping": VacuumActivity.CLEANING,
+    "sweeping": VacuumActivity.CLEANING,
+    "docked": VacuumActivity.DOCKED,
+    "charging": VacuumActivity.DOCKED,
+    "mop_cleaning": VacuumActivity.DOCKED,
+    "mop_airdrying": VacuumActivity.DOCKED,
+    "returning": VacuumActivity.RETURNING,
+    "docking": VacuumActivity.RETURNING,
+    "error": VacuumActivity.ERROR,
+    "paused": VacuumActivity.PAUSED,
+}
+
+
+def _activity_from_data(data: Any) -> VacuumActivity:
+    """Map the B01 status name to a vacuum activity."""
+    # B01Props has status_name directly, see the q7_status sensor
+    return _STATUS_TO_ACTIVITY.get(getattr(data, "status_name", None), VacuumActivity.IDLE)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,6 +56,8 @@ async def async_setup_entry(
     entities = []
 
     for coordinator in coordinators.b01:
+        if not isinstance(coordinator, RoborockB01Q7UpdateCoordinator):
+            continue
         device_name = coordinator.device_info["name"]
         _LOGGER.debug("Creating Roborock vacuum entity for device: %s", device_name)
         entity = RoborockVacuum(coordinator)
@@ -50,70 +77,49 @@ class RoborockVacuum(RoborockCoordinatedEntityB01, StateVacuumEntity):
         | VacuumEntityFeature.RETURN_HOME
         | VacuumEntityFeature.FAN_SPEED
     )
+    _attr_fan_speed_list = _FAN_SPEED_LIST
 
-    def __init__(self, coordinator: RoborockDataUpdateCoordinatorB01):
+    def __init__(self, coordinator: RoborockB01Q7UpdateCoordinator):
         _LOGGER.debug("Initializing RoborockVacuum entity for %s", coordinator.device_info["name"])
         super().__init__(coordinator.device_info["name"], coordinator)
+        self._attr_name = coordinator.device_info["name"]
+        self._attr_activity = _activity_from_data(coordinator.data)
+        self._q7_properties = coordinator.api
         self._available = True
 
-    @property
-    def name(self):
-        return self.coordinator.device_info["name"]
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
 
-    @property
-    def activity(self) -> VacuumActivity | None:
-        """Return the activity of the vacuum."""
-        # B01Props has status_name directly, or we can check status code
-        # Based on sensor.py: value_fn=lambda data: getattr(data, "status_name", None)
-        status_name = getattr(self.coordinator.data, "status_name", None)
-        
-        if status_name in ["cleaning", "sweep_moping", "sweep_moping_2", "moping", "sweeping"]:
-            return VacuumActivity.CLEANING
-        if status_name in ["docked", "charging", "mop_cleaning", "mop_airdrying"]:
-            return VacuumActivity.DOCKED
-        if status_name in ["returning", "docking"]:
-            return VacuumActivity.RETURNING
-        if status_name == "error":
-            return VacuumActivity.ERROR
-        if status_name == "paused":
-            return VacuumActivity.PAUSED
-        return VacuumActivity.IDLE
+        The activity only changes with new data, so it is resolved once here
+        rather than on every state read.
+        """
+        self._attr_activity = _activity_from_data(self.coordinator.data)
+        super()._handle_coordinator_update()
 
     @property
     def fan_speed(self) -> str | None:
         """Return the fan speed of the vacuum cleaner."""
-        # Map the internal code to a readable string if possible, or return the raw value
-        # Assuming coordinator.data has a way to access current fan speed
-        # Based on Q7PropertiesApi, we set it via SCWindMapping.
-        # We need to find where the current value is stored in coordinator.data
-        # For now, let's try to access it from status if available
-        return getattr(self.coordinator.data, "fan_speed", None)
-
-    @property
-    def fan_speed_list(self) -> list[str]:
-        """Return the list of available fan speeds."""
-        return [mode.name for mode in SCWindMapping]
+        return self.coordinator.data.wind_name
 
     async def async_set_fan_speed(self, fan_speed: str, **kwargs: Any) -> None:
         """Set fan speed."""
-        try:
-            mode = SCWindMapping[fan_speed]
-            await self.coordinator.device.b01_q7_properties.set_fan_speed(mode)
-        except KeyError:
+        if (mode := _FAN_SPEED_MEMBERS.get(fan_speed)) is None:
             _LOGGER.error("Invalid fan speed: %s", fan_speed)
+            return
+        await self._q7_properties.set_fan_speed(mode)
 
     async def async_start(self):
         _LOGGER.debug("Starting vacuum %s", self.name)
-        await self.coordinator.device.b01_q7_properties.start_clean()
+        await self._q7_properties.start_clean()
 
     async def async_pause(self):
         _LOGGER.debug("Pausing vacuum %s", self.name)
-        await self.coordinator.device.b01_q7_properties.pause_clean()
+        await self._q7_properties.pause_clean()
 
     async def async_stop(self):
         _LOGGER.debug("Stopping vacuum %s", self.name)
-        await self.coordinator.device.b01_q7_properties.stop_clean()
+        await self._q7_properties.stop_clean()
 
     async def async_return_to_base(self):
         _LOGGER.debug("Returning vacuum %s to dock", self.name)
-        await self.coordinator.device.b01_q7_properties.return_to_dock()
+        await self._q7_properties.return_to_dock()